@@ -13,23 +13,84 @@ Features:
 - Non-blocking CPU monitoring
 """
 
-import psutil
 import logging
 import os
+import sys
 import threading
+import time
 import functools
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any, TypeVar
+from collections import deque
+from itertools import islice
+from dataclasses import astuple, dataclass, field, replace
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Callable, Any, Set, Tuple, TypeVar
 from datetime import datetime, timedelta
 from enum import Enum
 
 # Import centralized secrets management
 from core.secrets import get_secret
 
+if TYPE_CHECKING:
+    import numpy as np
+
 T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
+# psutil and numpy are imported on first use (see _get_psutil/_get_numpy) to
+# keep module import cheap
+_psutil: Any = None
+_numpy: Any = None
+
+# Blocking CPU interval (seconds) for a thread's first sample: psutil keeps the
+# cpu_percent(interval=0) baseline per thread, so without it the first
+# non-blocking read from a new thread reports 0.0
+_CPU_BASELINE_INTERVAL = 0.1
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _get_psutil() -> Any:
+    """Import psutil on first use and return the module"""
+    global _psutil
+    if _psutil is None:
+        import psutil
+        _psutil = psutil
+    return _psutil
+
+
+def _get_numpy() -> Any:
+    """Import numpy on first use and return the module"""
+    global _numpy
+    if _numpy is None:
+        import numpy
+        _numpy = numpy
+    return _numpy
+
+
+def _disk_usage_percent(path: str = '/') -> float:
+    """
+    Get disk usage percentage for the filesystem containing ``path``.
+
+    Calls os.statvfs() directly and computes the percentage the same way as
+    psutil.disk_usage() (reserved blocks excluded, rounded to 0.1), skipping
+    psutil's named-tuple construction. Falls back to psutil on platforms
+    without statvfs (Windows).
+
+    Args:
+        path: Any path on the filesystem to inspect
+
+    Returns:
+        Disk usage percentage (0-100)
+    """
+    if not hasattr(os, 'statvfs'):
+        return _get_psutil().disk_usage(path).percent
+
+    st = os.statvfs(path)
+    used = st.f_blocks - st.f_bfree
+    total_user = used + st.f_bavail
+    return round(used / total_user * 100, 1) if total_user else 0.0
+
 
 def monitor_operation_resources(operation_name: Optional[str] = None):
     """
@@ -56,8 +117,9 @@ def monitor_operation_resources(operation_name: Optional[str] = None):
             op_name = operation_name or func.__name__
             monitor = get_resource_monitor()
 
-            # Get initial metrics
-            initial_metrics = monitor.get_current_metrics()
+            # Get initial metrics (bypass the sample cache so the before/after
+            # readings are distinct even for operations shorter than its TTL)
+            initial_metrics = monitor.get_current_metrics(use_cache=False)
 
             logger.debug(
                 f"Starting operation '{op_name}' - "
@@ -71,7 +133,7 @@ def monitor_operation_resources(operation_name: Optional[str] = None):
                 result = func(*args, **kwargs)
 
                 # Get final metrics
-                final_metrics = monitor.get_current_metrics()
+                final_metrics = monitor.get_current_metrics(use_cache=False)
 
                 # Calculate resource usage during operation
                 cpu_used = final_metrics.cpu_percent - initial_metrics.cpu_percent
@@ -100,7 +162,7 @@ def monitor_operation_resources(operation_name: Optional[str] = None):
 
             except Exception as e:
                 # Log resource usage even on failure
-                final_metrics = monitor.get_current_metrics()
+                final_metrics = monitor.get_current_metrics(use_cache=False)
                 cpu_used = final_metrics.cpu_percent - initial_metrics.cpu_percent
                 memory_used = final_metrics.process_memory_mb - initial_metrics.process_memory_mb
 
@@ -123,10 +185,36 @@ class ResourceStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
-class ResourceMetrics:
+# Status values ordered by severity; _threshold_classifier()
+# yields indices into this tuple
+_STATUS_LEVELS = (
+    ResourceStatus.HEALTHY.value,
+    ResourceStatus.WARNING.value,
+    ResourceStatus.CRITICAL.value,
+)
+_WARNING_LEVEL = 1
+_CRITICAL_LEVEL = 2
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class _ResourceMetricsFields:
+    """Dataclass fields of ResourceMetrics (see that class)"""
+    cpu_percent: float
+    memory_percent: float
+    memory_available_mb: float
+    disk_usage_percent: float
+    process_memory_mb: float
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+class ResourceMetrics(_ResourceMetricsFields):
     """
     Snapshot of system resource metrics.
+
+    Immutable and slotted: many snapshots are retained in monitor history,
+    and cached samples are shared between callers. The serialized form is
+    cached in a slot outside the dataclass fields, so fields(), asdict()
+    and replace() see only the attributes below.
     
     Attributes:
         cpu_percent: CPU utilization percentage (0-100)
@@ -136,29 +224,58 @@ class ResourceMetrics:
         process_memory_mb: Memory used by current process
         timestamp: When metrics were collected
     """
-    cpu_percent: float
-    memory_percent: float
-    memory_available_mb: float
-    disk_usage_percent: float
-    process_memory_mb: float
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Serialized form, built on the first to_dict() call
+    __slots__ = ('_dict_cache',)
+    
+    def __reduce__(self):
+        # Rebuild from the fields alone; the frozen __setattr__ would reject
+        # restoring the cache slot
+        return (self.__class__, astuple(self))
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            'cpu_percent': round(self.cpu_percent, 2),
-            'memory_percent': round(self.memory_percent, 2),
-            'memory_available_mb': round(self.memory_available_mb, 2),
-            'disk_usage_percent': round(self.disk_usage_percent, 2),
-            'process_memory_mb': round(self.process_memory_mb, 2),
-            'timestamp': self.timestamp.isoformat()
-        }
+        """
+        Convert to dictionary for JSON serialization.
+
+        The dictionary is built once per snapshot; callers get a copy.
+        """
+        data = getattr(self, '_dict_cache', None)
+        if data is None:
+            data = {
+                'cpu_percent': round(self.cpu_percent, 2),
+                'memory_percent': round(self.memory_percent, 2),
+                'memory_available_mb': round(self.memory_available_mb, 2),
+                'disk_usage_percent': round(self.disk_usage_percent, 2),
+                'process_memory_mb': round(self.process_memory_mb, 2),
+                'timestamp': self.timestamp.isoformat()
+            }
+            object.__setattr__(self, '_dict_cache', data)
+        return dict(data)
 
 
-@dataclass
+# Zero-valued template for snapshots returned when monitoring is disabled or
+# sampling fails. Never added to history; use _zero_metrics() so each caller
+# gets a current timestamp.
+_ZERO_METRICS = ResourceMetrics(
+    cpu_percent=0.0,
+    memory_percent=0.0,
+    memory_available_mb=0.0,
+    disk_usage_percent=0.0,
+    process_memory_mb=0.0
+)
+
+
+def _zero_metrics() -> ResourceMetrics:
+    """Return the zero snapshot stamped with the current time."""
+    return replace(_ZERO_METRICS, timestamp=datetime.now())
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ResourceThresholds:
     """
     Configurable thresholds for resource monitoring.
+
+    Immutable; assign a new instance to ``ResourceMonitor.thresholds`` to
+    change limits at runtime.
     
     Attributes:
         cpu_warning: CPU % to trigger warning (default: 70%)
@@ -176,6 +293,169 @@ class ResourceThresholds:
     disk_critical: float = 95.0
 
 
+@functools.lru_cache(maxsize=32)
+def _threshold_classifier(
+    thresholds: ResourceThresholds,
+) -> Callable[[float, float, float], Tuple[int, int, int]]:
+    """
+    Build a classifier with the threshold values bound as closure
+    constants, avoiding attribute lookups on every health check.
+
+    Cached per distinct ResourceThresholds value (the dataclass is frozen
+    and hashable), so the instance itself stays a plain, picklable record.
+
+    The classifier maps (cpu, memory, disk) percentages to severity
+    indices into _STATUS_LEVELS: 0 healthy, 1 warning, 2 critical.
+    The critical threshold is checked first, so it wins even when
+    configured below the warning threshold.
+    """
+    cpu_warning, cpu_critical = thresholds.cpu_warning, thresholds.cpu_critical
+    memory_warning, memory_critical = thresholds.memory_warning, thresholds.memory_critical
+    disk_warning, disk_critical = thresholds.disk_warning, thresholds.disk_critical
+
+    def classify(cpu: float, memory: float, disk: float) -> Tuple[int, int, int]:
+        return (
+            2 if cpu >= cpu_critical else 1 if cpu >= cpu_warning else 0,
+            2 if memory >= memory_critical else 1 if memory >= memory_warning else 0,
+            2 if disk >= disk_critical else 1 if disk >= disk_warning else 0,
+        )
+
+    return classify
+
+
+def _classify_levels(values: 'np.ndarray', warning: float, critical: float) -> 'np.ndarray':
+    """Vectorized form of _threshold_classifier for one metric column"""
+    np = _get_numpy()
+    return np.where(values >= critical, 2, np.where(values >= warning, 1, 0))
+
+
+class _RunningStats:
+    """
+    Running sum/min/max of one metric column.
+
+    Sums are updated on every append and eviction. Min/max are updated on
+    append; evicting a value equal to either extreme marks them stale, and
+    they are recomputed from the column on next use.
+
+    An error in the running sum persists until the buffer empties, so every
+    update and summary must happen under the owning monitor's history lock.
+    """
+
+    __slots__ = ('total', 'minimum', 'maximum', 'stale')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = float('-inf')
+        self.stale = False
+
+    def add(self, value: float):
+        self.total += value
+        if not self.stale:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+
+    def remove(self, value: float):
+        self.total -= value
+        if value <= self.minimum or value >= self.maximum:
+            self.stale = True
+
+    def summary(self, column: 'np.ndarray', columns: '_MetricColumns') -> Dict[str, float]:
+        """
+        min/max/avg over the entries retained in ``columns``.
+
+        Retained indices are only materialized when the extremes are stale.
+        """
+        if self.stale:
+            values = column[columns.valid_indices()]
+            self.minimum = float(values.min())
+            self.maximum = float(values.max())
+            self.stale = False
+        return {
+            'min': self.minimum,
+            'max': self.maximum,
+            'avg': self.total / columns.count
+        }
+
+
+class _MetricColumns:
+    """
+    Fixed-capacity NumPy ring buffer of numeric metric columns.
+
+    Mirrors the monitor's snapshot history column-wise (struct-of-arrays) so
+    summaries can aggregate in one vectorized pass per column. CPU and memory
+    also keep running statistics over all retained entries, so a summary
+    whose window covers the whole buffer is O(1).
+
+    The arrays are allocated on the first append, so monitors that never
+    record history do not import numpy.
+
+    Not thread-safe: ResourceMonitor guards every access with its history
+    lock.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.cpu: Optional['np.ndarray'] = None
+        self.memory: Optional['np.ndarray'] = None
+        self.disk: Optional['np.ndarray'] = None
+        self.timestamps: Optional['np.ndarray'] = None
+        self.cpu_stats = _RunningStats()
+        self.memory_stats = _RunningStats()
+        self._head = 0  # Total number of appends
+        self.count = 0  # Number of valid (retained) entries
+
+    def append(self, metrics: ResourceMetrics):
+        """Append a snapshot, overwriting the oldest entry when full"""
+        if self.capacity == 0:
+            return
+        if self.cpu is None:
+            self._allocate()
+        i = self._head % self.capacity
+        if self.count == self.capacity:
+            self._evict(i)
+        self.cpu[i] = metrics.cpu_percent
+        self.memory[i] = metrics.memory_percent
+        self.disk[i] = metrics.disk_usage_percent
+        self.timestamps[i] = metrics.timestamp.timestamp()
+        self.cpu_stats.add(metrics.cpu_percent)
+        self.memory_stats.add(metrics.memory_percent)
+        self._head += 1
+        self.count = min(self.count + 1, self.capacity)
+
+    def _allocate(self):
+        np = _get_numpy()
+        # Zero-filled so a slot is never read back as uninitialized memory
+        self.cpu = np.zeros(self.capacity, dtype=np.float64)
+        self.memory = np.zeros(self.capacity, dtype=np.float64)
+        self.disk = np.zeros(self.capacity, dtype=np.float64)
+        self.timestamps = np.zeros(self.capacity, dtype=np.float64)
+
+    def drop_oldest(self):
+        """Forget the oldest retained entry"""
+        self._evict((self._head - self.count) % self.capacity)
+        self.count -= 1
+        if self.count == 0:
+            # Start over from exact zeros rather than accumulated rounding error
+            self.cpu_stats.reset()
+            self.memory_stats.reset()
+
+    def _evict(self, i: int):
+        self.cpu_stats.remove(float(self.cpu[i]))
+        self.memory_stats.remove(float(self.memory[i]))
+
+    def oldest_timestamp(self) -> float:
+        """Timestamp of the oldest retained entry (buffer must not be empty)"""
+        return float(self.timestamps[(self._head - self.count) % self.capacity])
+
+    def valid_indices(self) -> 'np.ndarray':
+        """Buffer indices of retained entries, oldest first"""
+        return _get_numpy().arange(self._head - self.count, self._head) % max(self.capacity, 1)
+
+
 class ResourceMonitor:
     """
     Monitor system resource utilization.
@@ -189,24 +469,65 @@ class ResourceMonitor:
         thresholds: Optional[ResourceThresholds] = None,
         history_size: int = 100,
         history_time_window_hours: int = 1,
-        monitoring_enabled: bool = True
+        monitoring_enabled: bool = True,
+        cache_ttl_seconds: float = 0.1,
+        disk_sample_interval_seconds: float = 5.0,
+        synthetic: Optional[bool] = None
     ):
         """
         Initialize resource monitor.
 
         Args:
             thresholds: Custom threshold configuration (uses defaults if None)
-            history_size: Number of metric snapshots to retain
+            history_size: Number of metric snapshots to retain (0 disables history)
             history_time_window_hours: Time window in hours to retain metrics
             monitoring_enabled: Whether monitoring is active
+            cache_ttl_seconds: Reuse the last sample for calls made within this
+                many seconds (0 disables caching)
+            disk_sample_interval_seconds: Minimum seconds between disk usage
+                queries; the last value is reused in between
+            synthetic: Return fixed synthetic metrics instead of querying
+                psutil (defaults to ASTRAGUARD_RM_SYNTHETIC=1 in the environment)
         """
         self.thresholds = thresholds or ResourceThresholds()
-        self.history_size = history_size
         self.history_time_window_hours = history_time_window_hours
         self.monitoring_enabled = monitoring_enabled
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.disk_sample_interval_seconds = disk_sample_interval_seconds
+        if synthetic is None:
+            synthetic = os.environ.get('ASTRAGUARD_RM_SYNTHETIC') == '1'
+        self.synthetic = synthetic
+        if synthetic:
+            logger.warning(
+                "ResourceMonitor in synthetic mode: reporting fixed metrics, "
+                "not real system usage (unset ASTRAGUARD_RM_SYNTHETIC outside tests)"
+            )
+
+        # Ring buffer: appends past history_size evict the oldest entry.
+        # The lock keeps the deque and the column buffer in step when the
+        # monitor is sampled from several threads.
+        self._history_lock = threading.Lock()
+        self._metrics_history: Deque[ResourceMetrics] = deque(maxlen=history_size)
+        self._metric_columns = _MetricColumns(history_size)
+        self._process: Any = None  # psutil.Process, created on first sample
+
+        # Last successful sample, reused by get_current_metrics() within the TTL
+        self._last_metrics: Optional[ResourceMetrics] = None
+        self._last_sample_time = 0.0
+
+        # Last check_resource_health() (sample, thresholds, result), stored as
+        # one tuple so concurrent checks cannot pair one key with another's result
+        self._health_cache: Optional[Tuple[ResourceMetrics, ResourceThresholds, Dict[str, str]]] = None
+
+        # Disk usage changes slowly, so it is sampled on its own interval
+        self._last_disk_percent = 0.0
+        self._last_disk_time: Optional[float] = None
+
+        # Idents of threads that have a psutil cpu_percent(interval=0) baseline
+        self._cpu_baseline_threads: Set[int] = set()
 
-        self._metrics_history: List[ResourceMetrics] = []
-        self._process = psutil.Process()
+        if self.monitoring_enabled and not self.synthetic:
+            self._prime_cpu_percent()
 
         logger.info(
             f"ResourceMonitor initialized: "
@@ -215,71 +536,67 @@ class ResourceMonitor:
             f"history_size={self.history_size}, "
             f"history_time_window={self.history_time_window_hours}h"
         )
+
+    @property
+    def history_size(self) -> int:
+        """Maximum number of metric snapshots retained in history"""
+        return self._metrics_history.maxlen
+
+    @history_size.setter
+    def history_size(self, value: int):
+        with self._history_lock:
+            self._metrics_history = deque(self._metrics_history, maxlen=value)
+            self._metric_columns = _MetricColumns(value)
+            for metrics in self._metrics_history:
+                self._metric_columns.append(metrics)
     
-    def get_current_metrics(self) -> ResourceMetrics:
+    def get_current_metrics(self, use_cache: bool = True) -> ResourceMetrics:
         """
         Collect current resource metrics.
 
-        Uses interval=0 for CPU to ensure non-blocking operation.
+        Uses interval=0 for CPU to ensure non-blocking operation; the value
+        is utilization since the previous reading. psutil tracks that
+        reading per thread, so the constructor primes the constructing
+        thread, and the first sample taken from any other thread blocks
+        for a short interval instead of reporting 0.0. Calls made
+        within ``cache_ttl_seconds`` of the previous sample return that sample
+        without querying psutil again (and without adding to history).
+
+        Args:
+            use_cache: Reuse a sample taken within the TTL (False forces a
+                fresh sample)
 
         Returns:
             ResourceMetrics snapshot of current system state
         """
         if not self.monitoring_enabled:
-            return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
-            )
+            return _zero_metrics()
+
+        # One clock reading drives the TTL check and the sample timestamp;
+        # a clock that stepped backwards counts as expired.
+        now = time.time()
+        if (
+            use_cache
+            and self._last_metrics is not None
+            and 0.0 <= now - self._last_sample_time < self.cache_ttl_seconds
+        ):
+            return self._last_metrics
 
         try:
-            # CPU usage (interval=0 for non-blocking return)
-            # This returns usage since last call, which is ideal for periodic monitoring
-            cpu_percent = psutil.cpu_percent(interval=0)
-            # CPU usage (1 second interval for accuracy)
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            metrics = self._sample_metrics(now)
 
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent if memory.percent is not None else 0.0
-            memory_available_mb = memory.available / (1024 * 1024) if memory.available is not None else 0.0
-
-            # Disk usage - with fallback for CI environments
-            try:
-                disk = psutil.disk_usage('/')
-                disk_usage_percent = disk.percent if disk.percent is not None else 0.0
-            except (OSError, PermissionError):
-                disk_usage_percent = 0.0
+            # Add to history (history_size=0 means nothing is retained)
+            if self.history_size > 0:
+                self._add_to_history(metrics)
 
-            # Process memory
-            process_info = self._process.memory_info()
-            process_memory_mb = process_info.rss / (1024 * 1024) if process_info.rss is not None else 0.0
-
-            metrics = ResourceMetrics(
-                cpu_percent=float(cpu_percent) if cpu_percent is not None else 0.0,
-                memory_percent=float(memory_percent) if memory_percent is not None else 0.0,
-                memory_available_mb=float(memory_available_mb) if memory_available_mb is not None else 0.0,
-                disk_usage_percent=float(disk_usage_percent) if disk_usage_percent is not None else 0.0,
-                process_memory_mb=float(process_memory_mb) if process_memory_mb is not None else 0.0,
-                timestamp=datetime.now()
-            )
-
-            # Add to history
-            self._add_to_history(metrics)
+            self._last_metrics = metrics
+            self._last_sample_time = now
 
             return metrics
 
         except Exception as e:
             logger.error(f"Error collecting resource metrics: {e}")
-            return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
-            )
+            return _zero_metrics()
 
     def get_current_metrics_no_history(self) -> ResourceMetrics:
         """
@@ -291,68 +608,142 @@ class ResourceMonitor:
             ResourceMetrics snapshot of current system state
         """
         if not self.monitoring_enabled:
+            return _zero_metrics()
+
+        try:
+            return self._sample_metrics(time.time())
+
+        except Exception as e:
+            logger.error(f"Error collecting resource metrics: {e}")
+            return _zero_metrics()
+    
+    def _prime_cpu_percent(self):
+        """
+        Take a throwaway non-blocking CPU reading.
+
+        psutil.cpu_percent(interval=0) reports utilization since the previous
+        call in the same thread; priming here means the first real sample
+        measures the time since construction instead of returning 0.0.
+        """
+        try:
+            _get_psutil().cpu_percent(interval=0)
+            self._cpu_baseline_threads.add(threading.get_ident())
+        except Exception as e:
+            logger.debug(f"Could not prime CPU percent sampling: {e}")
+
+    def _sample_metrics(self, now: float) -> ResourceMetrics:
+        """
+        Query psutil for a single metrics snapshot.
+
+        Process-level reads are wrapped in ``oneshot()`` so psutil can reuse
+        the underlying /proc data across calls on the cached Process handle.
+
+        Args:
+            now: time.time() reading taken by the caller for this sample;
+                also used as the snapshot timestamp
+
+        Returns:
+            ResourceMetrics snapshot of current system state
+        """
+        if self.synthetic:
+            # Deterministic values (healthy under default thresholds), no psutil
             return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
+                cpu_percent=42.0,
+                memory_percent=42.0,
+                memory_available_mb=1024.0,
+                disk_usage_percent=42.0,
+                process_memory_mb=42.0,
+                timestamp=datetime.fromtimestamp(now)
             )
 
-        try:
-            # CPU usage (interval=0 for non-blocking return)
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+        psutil = _get_psutil()
+        if self._process is None:
+            self._process = psutil.Process()
+
+        with self._process.oneshot():
+            # CPU usage since this thread's previous call (non-blocking once
+            # the thread has a baseline; see get_current_metrics)
+            thread_id = threading.get_ident()
+            if thread_id in self._cpu_baseline_threads:
+                cpu_percent = psutil.cpu_percent(interval=0)
+            else:
+                cpu_percent = psutil.cpu_percent(interval=_CPU_BASELINE_INTERVAL)
+                self._cpu_baseline_threads.add(thread_id)
 
             # Memory usage
             memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_available_mb = memory.available / (1024 * 1024)
+            memory_percent = memory.percent if memory.percent is not None else 0.0
+            memory_available_mb = memory.available / (1024 * 1024) if memory.available is not None else 0.0
 
             # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_usage_percent = disk.percent
+            disk_usage_percent = self._sample_disk_percent(now)
 
             # Process memory
             process_info = self._process.memory_info()
-            process_memory_mb = process_info.rss / (1024 * 1024)
+            process_memory_mb = process_info.rss / (1024 * 1024) if process_info.rss is not None else 0.0
 
-            return ResourceMetrics(
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                memory_available_mb=memory_available_mb,
-                disk_usage_percent=disk_usage_percent,
-                process_memory_mb=process_memory_mb,
-                timestamp=datetime.now()
-            )
+        return ResourceMetrics(
+            cpu_percent=float(cpu_percent) if cpu_percent is not None else 0.0,
+            memory_percent=float(memory_percent),
+            memory_available_mb=float(memory_available_mb),
+            disk_usage_percent=float(disk_usage_percent),
+            process_memory_mb=float(process_memory_mb),
+            timestamp=datetime.fromtimestamp(now)
+        )
 
-        except Exception as e:
-            logger.error(f"Error collecting resource metrics: {e}")
-            return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
-            )
-    
-    def _add_to_history(self, metrics: ResourceMetrics):
-        """Add metrics to history, maintaining size and time limits"""
-        self._metrics_history.append(metrics)
+    def _sample_disk_percent(self, now: float) -> float:
+        """
+        Get root disk usage, querying psutil at most once per
+        ``disk_sample_interval_seconds``.
 
-        # Clean up old entries based on time window
-        cutoff_time = datetime.now() - timedelta(hours=self.history_time_window_hours)
-        self._metrics_history = [
-            m for m in self._metrics_history
-            if m.timestamp >= cutoff_time
-        ]
+        Args:
+            now: time.time() reading for the current sample
 
-        # Trim history if exceeded size (after time-based cleanup)
-        if len(self._metrics_history) > self.history_size:
-            self._metrics_history = self._metrics_history[-self.history_size:]
+        Returns:
+            Disk usage percentage (0.0 if the disk cannot be queried)
+        """
+        if (
+            self._last_disk_time is not None
+            and 0.0 <= now - self._last_disk_time < self.disk_sample_interval_seconds
+        ):
+            return self._last_disk_percent
+
+        # Fallback for CI environments where '/' may not be readable
+        try:
+            disk_usage_percent = _disk_usage_percent('/')
+        except (OSError, PermissionError):
+            disk_usage_percent = 0.0
+
+        self._last_disk_percent = disk_usage_percent
+        self._last_disk_time = now
+        return disk_usage_percent
+
+    def _add_to_history(self, metrics: ResourceMetrics):
+        """Add metrics to history, maintaining size and time limits"""
+        # deque(maxlen=history_size) drops the oldest entry once full, as
+        # does the column buffer sharing its capacity
+        cutoff_time = metrics.timestamp - timedelta(hours=self.history_time_window_hours)
+        with self._history_lock:
+            history = self._metrics_history
+            history.append(metrics)
+            self._metric_columns.append(metrics)
+
+            # Entries are appended in time order, so expired ones sit at the
+            # left. The new sample was just taken, so its timestamp stands in
+            # for "now".
+            while history and history[0].timestamp < cutoff_time:
+                history.popleft()
+                self._metric_columns.drop_oldest()
     
-    def check_resource_health(self) -> Dict[str, str]:
+    def check_resource_health(self, use_cache: bool = True) -> Dict[str, str]:
         """
         Check if resources are within safe limits.
+
+        The result is cached per (sample, thresholds) pair, so repeated calls
+        that get the same cached sample skip classification and logging.
+
+        Args:
+            use_cache: Reuse a recent sample (see get_current_metrics)
         
         Returns:
             Dictionary with status for each resource type:
@@ -363,76 +754,75 @@ class ResourceMonitor:
                 'overall': 'healthy' | 'warning' | 'critical'
             }
         """
-        metrics = self.get_current_metrics()
-        
+        metrics = self.get_current_metrics(use_cache=use_cache)
+        thresholds = self.thresholds
+
+        cached = self._health_cache
+        if cached is not None and cached[0] is metrics and cached[1] is thresholds:
+            return dict(cached[2])
+
+        # Index into _STATUS_LEVELS: 0 healthy, 1 warning, 2 critical
+        cpu_level, memory_level, disk_level = _threshold_classifier(thresholds)(
+            metrics.cpu_percent, metrics.memory_percent, metrics.disk_usage_percent
+        )
+
+        if cpu_level == _CRITICAL_LEVEL:
+            logger.warning(
+                f"CPU critical: {metrics.cpu_percent:.1f}% "
+                f"(threshold: {thresholds.cpu_critical}%)"
+            )
+        elif cpu_level == _WARNING_LEVEL:
+            logger.info(
+                f"CPU warning: {metrics.cpu_percent:.1f}% "
+                f"(threshold: {thresholds.cpu_warning}%)"
+            )
+
+        if memory_level == _CRITICAL_LEVEL:
+            logger.warning(
+                f"Memory critical: {metrics.memory_percent:.1f}% "
+                f"(threshold: {thresholds.memory_critical}%)"
+            )
+        elif memory_level == _WARNING_LEVEL:
+            logger.info(
+                f"Memory warning: {metrics.memory_percent:.1f}% "
+                f"(threshold: {thresholds.memory_warning}%)"
+            )
+
+        if disk_level == _CRITICAL_LEVEL:
+            logger.warning(
+                f"Disk critical: {metrics.disk_usage_percent:.1f}% "
+                f"(threshold: {thresholds.disk_critical}%)"
+            )
+
+        # Overall status: worst status wins
         status = {
-            'cpu': ResourceStatus.HEALTHY,
-            'memory': ResourceStatus.HEALTHY,
-            'disk': ResourceStatus.HEALTHY,
-            'overall': ResourceStatus.HEALTHY
+            'cpu': _STATUS_LEVELS[cpu_level],
+            'memory': _STATUS_LEVELS[memory_level],
+            'disk': _STATUS_LEVELS[disk_level],
+            'overall': _STATUS_LEVELS[max(cpu_level, memory_level, disk_level)],
         }
-        
-        # Check CPU (handle None values)
-        if metrics.cpu_percent is not None:
-            if metrics.cpu_percent >= self.thresholds.cpu_critical:
-                status['cpu'] = ResourceStatus.CRITICAL
-                logger.warning(
-                    f"CPU critical: {metrics.cpu_percent:.1f}% "
-                    f"(threshold: {self.thresholds.cpu_critical}%)"
-                )
-            elif metrics.cpu_percent >= self.thresholds.cpu_warning:
-                status['cpu'] = ResourceStatus.WARNING
-                logger.info(
-                    f"CPU warning: {metrics.cpu_percent:.1f}% "
-                    f"(threshold: {self.thresholds.cpu_warning}%)"
-                )
-        
-        # Check Memory (handle None values)
-        if metrics.memory_percent is not None:
-            if metrics.memory_percent >= self.thresholds.memory_critical:
-                status['memory'] = ResourceStatus.CRITICAL
-                logger.warning(
-                    f"Memory critical: {metrics.memory_percent:.1f}% "
-                    f"(threshold: {self.thresholds.memory_critical}%)"
-                )
-            elif metrics.memory_percent >= self.thresholds.memory_warning:
-                status['memory'] = ResourceStatus.WARNING
-                logger.info(
-                    f"Memory warning: {metrics.memory_percent:.1f}% "
-                    f"(threshold: {self.thresholds.memory_warning}%)"
-                )
-        
-        # Check Disk (handle None values)
-        if metrics.disk_usage_percent is not None:
-            if metrics.disk_usage_percent >= self.thresholds.disk_critical:
-                status['disk'] = ResourceStatus.CRITICAL
-                logger.warning(
-                    f"Disk critical: {metrics.disk_usage_percent:.1f}% "
-                    f"(threshold: {self.thresholds.disk_critical}%)"
-                )
-            elif metrics.disk_usage_percent >= self.thresholds.disk_warning:
-                status['disk'] = ResourceStatus.WARNING
-        
-        # Determine overall status (worst status wins)
-        if any(s == ResourceStatus.CRITICAL for s in status.values()):
-            status['overall'] = ResourceStatus.CRITICAL
-        elif any(s == ResourceStatus.WARNING for s in status.values()):
-            status['overall'] = ResourceStatus.WARNING
-        
-        return {k: v.value for k, v in status.items()}
+
+        self._health_cache = (metrics, thresholds, status)
+        return dict(status)
     
-    def is_resource_available(self, min_cpu_free: float = 10.0, min_memory_mb: float = 100.0) -> bool:
+    def is_resource_available(
+        self,
+        min_cpu_free: float = 10.0,
+        min_memory_mb: float = 100.0,
+        use_cache: bool = True
+    ) -> bool:
         """
         Check if sufficient resources are available for operations.
         
         Args:
             min_cpu_free: Minimum free CPU percentage required
             min_memory_mb: Minimum free memory in MB required
+            use_cache: Reuse a recent sample (see get_current_metrics)
         
         Returns:
             True if resources are available, False otherwise
         """
-        metrics = self.get_current_metrics()
+        metrics = self.get_current_metrics(use_cache=use_cache)
         
         cpu_free = 100.0 - metrics.cpu_percent
         memory_available = metrics.memory_available_mb
@@ -461,34 +851,96 @@ class ResourceMonitor:
         Returns:
             Dictionary with min/max/avg for each metric
         """
-        cutoff_time = datetime.now() - timedelta(minutes=duration_minutes)
-        recent_metrics = [
-            m for m in self._metrics_history 
-            if m.timestamp >= cutoff_time
-        ]
-        
-        if not recent_metrics:
-            return {'error': 'No metrics available'}
+        cutoff = (datetime.now() - timedelta(minutes=duration_minutes)).timestamp()
         
-        cpu_values = [m.cpu_percent for m in recent_metrics]
-        memory_values = [m.memory_percent for m in recent_metrics]
+        with self._history_lock:
+            columns = self._metric_columns
+            if columns.count == 0:
+                return {'error': 'No metrics available'}
+            
+            if columns.oldest_timestamp() >= cutoff:
+                # Window covers all retained history: use the running statistics
+                samples = columns.count
+                cpu_summary = columns.cpu_stats.summary(columns.cpu, columns)
+                memory_summary = columns.memory_stats.summary(columns.memory, columns)
+            else:
+                indices = columns.valid_indices()
+                recent = indices[columns.timestamps[indices] >= cutoff]
+                if recent.size == 0:
+                    return {'error': 'No metrics available'}
+                
+                cpu_values = columns.cpu[recent]
+                memory_values = columns.memory[recent]
+                samples = int(recent.size)
+                cpu_summary = {
+                    'min': float(cpu_values.min()),
+                    'max': float(cpu_values.max()),
+                    'avg': float(cpu_values.mean())
+                }
+                memory_summary = {
+                    'min': float(memory_values.min()),
+                    'max': float(memory_values.max()),
+                    'avg': float(memory_values.mean())
+                }
         
+        # Outside the lock: sampling may append to history
         return {
             'timeframe_minutes': duration_minutes,
-            'samples': len(recent_metrics),
-            'cpu': {
-                'min': min(cpu_values),
-                'max': max(cpu_values),
-                'avg': sum(cpu_values) / len(cpu_values)
-            },
-            'memory': {
-                'min': min(memory_values),
-                'max': max(memory_values),
-                'avg': sum(memory_values) / len(memory_values)
-            },
+            'samples': samples,
+            'cpu': cpu_summary,
+            'memory': memory_summary,
             'current': self.get_current_metrics().to_dict()
         }
     
+    def get_history_health(self, count: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Classify recent history entries against the current thresholds.
+
+        Classification runs vectorized over the history columns
+        rather than per sample, using the same critical-first rule as
+        check_resource_health().
+        
+        Args:
+            count: Number of recent entries (None for all)
+        
+        Returns:
+            List of status dictionaries, oldest first, in the same format as
+            check_resource_health()
+        """
+        with self._history_lock:
+            columns = self._metric_columns
+            if columns.count == 0:
+                return []
+            
+            indices = columns.valid_indices()
+            if count:
+                indices = indices[-count:]
+            cpu_values = columns.cpu[indices]
+            memory_values = columns.memory[indices]
+            disk_values = columns.disk[indices]
+        
+        np = _get_numpy()
+        thresholds = self.thresholds
+        cpu_levels = _classify_levels(cpu_values, thresholds.cpu_warning, thresholds.cpu_critical)
+        memory_levels = _classify_levels(memory_values, thresholds.memory_warning, thresholds.memory_critical)
+        disk_levels = _classify_levels(disk_values, thresholds.disk_warning, thresholds.disk_critical)
+        overall_levels = np.maximum(np.maximum(cpu_levels, memory_levels), disk_levels)
+        
+        return [
+            {
+                'cpu': _STATUS_LEVELS[cpu],
+                'memory': _STATUS_LEVELS[memory],
+                'disk': _STATUS_LEVELS[disk],
+                'overall': _STATUS_LEVELS[overall],
+            }
+            for cpu, memory, disk, overall in zip(
+                cpu_levels.tolist(),
+                memory_levels.tolist(),
+                disk_levels.tolist(),
+                overall_levels.tolist(),
+            )
+        ]
+    
     def get_history(self, count: Optional[int] = None) -> List[Dict]:
         """
         Get recent metrics history.
@@ -499,7 +951,11 @@ class ResourceMonitor:
         Returns:
             List of metric dictionaries
         """
-        history = self._metrics_history[-count:] if count else self._metrics_history
+        with self._history_lock:
+            history = self._metrics_history
+            if count:
+                history = islice(history, max(len(history) - count, 0), None)
+            history = list(history)
         return [m.to_dict() for m in history]
 
 
@@ -508,51 +964,62 @@ _resource_monitor: Optional[ResourceMonitor] = None
 _resource_monitor_lock = threading.Lock()
 
 
+@functools.lru_cache(maxsize=None)
 def get_resource_monitor() -> ResourceMonitor:
     """
     Get global resource monitor singleton.
 
     Initializes with configuration from environment variables if not already created.
-    Thread-safe using double-checked locking pattern.
+    After the first call the instance is served from the function cache; the
+    lock only guards construction so concurrent first callers share one instance.
 
     Returns:
         ResourceMonitor singleton instance
     """
     global _resource_monitor
 
-    # First check without lock for performance
-    if _resource_monitor is None:
-        with _resource_monitor_lock:
-            # Double-check pattern: check again inside lock
-            if _resource_monitor is None:
-                import os
-
-                # Load configuration from environment, with fallback defaults
-                # Convert to float if get_secret returns a value, with direct os.environ fallback
-                cpu_warning = get_secret('resource_cpu_warning') or os.environ.get('RESOURCE_CPU_WARNING')
-                cpu_warning = float(cpu_warning) if cpu_warning else 70.0
-                
-                cpu_critical = get_secret('resource_cpu_critical') or os.environ.get('RESOURCE_CPU_CRITICAL')
-                cpu_critical = float(cpu_critical) if cpu_critical else 90.0
-                
-                memory_warning = get_secret('resource_memory_warning') or os.environ.get('RESOURCE_MEMORY_WARNING')
-                memory_warning = float(memory_warning) if memory_warning else 75.0
-                
-                memory_critical = get_secret('resource_memory_critical') or os.environ.get('RESOURCE_MEMORY_CRITICAL')
-                memory_critical = float(memory_critical) if memory_critical else 90.0
-
-                thresholds = ResourceThresholds(
-                    cpu_warning=cpu_warning,
-                    cpu_critical=cpu_critical,
-                    memory_warning=memory_warning,
-                    memory_critical=memory_critical,
-                )
+    with _resource_monitor_lock:
+        if _resource_monitor is None:
+            # Load configuration from environment, with fallback defaults
+            # Convert to float if get_secret returns a value, with direct os.environ fallback
+            cpu_warning = get_secret('resource_cpu_warning') or os.environ.get('RESOURCE_CPU_WARNING')
+            cpu_warning = float(cpu_warning) if cpu_warning else 70.0
+            
+            cpu_critical = get_secret('resource_cpu_critical') or os.environ.get('RESOURCE_CPU_CRITICAL')
+            cpu_critical = float(cpu_critical) if cpu_critical else 90.0
+            
+            memory_warning = get_secret('resource_memory_warning') or os.environ.get('RESOURCE_MEMORY_WARNING')
+            memory_warning = float(memory_warning) if memory_warning else 75.0
+            
+            memory_critical = get_secret('resource_memory_critical') or os.environ.get('RESOURCE_MEMORY_CRITICAL')
+            memory_critical = float(memory_critical) if memory_critical else 90.0
+
+            thresholds = ResourceThresholds(
+                cpu_warning=cpu_warning,
+                cpu_critical=cpu_critical,
+                memory_warning=memory_warning,
+                memory_critical=memory_critical,
+            )
 
-                monitoring_enabled = get_secret('resource_monitoring_enabled')
+            monitoring_enabled = get_secret('resource_monitoring_enabled')
 
-                _resource_monitor = ResourceMonitor(
-                    thresholds=thresholds,
-                    monitoring_enabled=monitoring_enabled
-                )
+            _resource_monitor = ResourceMonitor(
+                thresholds=thresholds,
+                monitoring_enabled=monitoring_enabled
+            )
+
+        return _resource_monitor
+
+
+def reset_resource_monitor() -> None:
+    """
+    Reset the global resource monitor singleton.
+
+    Forces re-creation (and re-reading of configuration) on the next
+    get_resource_monitor() call.
+    """
+    global _resource_monitor
 
-    return _resource_monitor
+    with _resource_monitor_lock:
+        _resource_monitor = None
+        get_resource_monitor.cache_clear()
@@ -14,13 +14,13 @@ class TestResourceMonitorEdgeCases:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_error_handling_in_metrics_collection(self, mock_disk, mock_memory, mock_cpu):
         """Test that metrics collection handles psutil errors gracefully"""
         # Make psutil raise an exception
         mock_cpu.side_effect = Exception("psutil error")
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         metrics = monitor.get_current_metrics()
         
         # Should return zero metrics on error
@@ -30,15 +30,15 @@ class TestResourceMonitorEdgeCases:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_cpu_critical_logging(self, mock_disk, mock_memory, mock_cpu):
         """Test CPU critical status triggers warning log"""
         # Set CPU to critical level
         mock_cpu.return_value = 95.0
         mock_memory.return_value = Mock(percent=50.0, available=2048*1024*1024)
-        mock_disk.return_value = Mock(percent=50.0)
+        mock_disk.return_value = 50.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         status = monitor.check_resource_health()
         
         assert status['cpu'] == 'critical'
@@ -46,15 +46,15 @@ class TestResourceMonitorEdgeCases:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_memory_warning_logging(self, mock_disk, mock_memory, mock_cpu):
         """Test memory warning status triggers info log"""
         # Set memory to warning level
         mock_cpu.return_value = 50.0
         mock_memory.return_value = Mock(percent=80.0, available=500*1024*1024)
-        mock_disk.return_value = Mock(percent=50.0)
+        mock_disk.return_value = 50.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         status = monitor.check_resource_health()
         
         assert status['memory'] == 'warning'
@@ -62,15 +62,15 @@ class TestResourceMonitorEdgeCases:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_disk_critical_logging(self, mock_disk, mock_memory, mock_cpu):
         """Test disk critical status triggers warning log"""
         # Set disk to critical level
         mock_cpu.return_value = 50.0
         mock_memory.return_value = Mock(percent=50.0, available=2048*1024*1024)
-        mock_disk.return_value = Mock(percent=96.0)  # Above 95% critical threshold
+        mock_disk.return_value = 96.0  # Above 95% critical threshold
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         status = monitor.check_resource_health()
         
         assert status['disk'] == 'critical'
@@ -78,29 +78,29 @@ class TestResourceMonitorEdgeCases:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_disk_warning_logging(self, mock_disk, mock_memory, mock_cpu):
         """Test disk warning status"""
         # Set disk to warning level
         mock_cpu.return_value = 50.0
         mock_memory.return_value = Mock(percent=50.0, available=2048*1024*1024)
-        mock_disk.return_value = Mock(percent=85.0)  # Above 80% warning threshold
+        mock_disk.return_value = 85.0  # Above 80% warning threshold
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         status = monitor.check_resource_health()
         
         assert status['disk'] == 'warning'
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_insufficient_memory_warning(self, mock_disk, mock_memory, mock_cpu):
         """Test insufficient memory triggers warning log"""
         mock_cpu.return_value = 50.0
         mock_memory.return_value = Mock(percent=60.0, available=50*1024*1024)  # Only 50MB
-        mock_disk.return_value = Mock(percent=50.0)
+        mock_disk.return_value = 50.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         # Request 200MB but only 50MB available
         available = monitor.is_resource_available(min_cpu_free=10.0, min_memory_mb=200.0)
         
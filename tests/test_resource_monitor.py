@@ -8,9 +8,16 @@ Validates:
 - Historical metrics tracking
 """
 
+import itertools
+import os
+import pickle
+import subprocess
+import sys
+import threading
 import pytest
 import psutil
-from unittest.mock import Mock, patch
+from dataclasses import FrozenInstanceError, asdict, fields, replace
+from unittest.mock import MagicMock, Mock, patch
 from datetime import datetime, timedelta
 from core.resource_monitor import (
     ResourceMonitor,
@@ -18,6 +25,9 @@ from core.resource_monitor import (
     ResourceThresholds,
     ResourceStatus,
     get_resource_monitor,
+    monitor_operation_resources,
+    reset_resource_monitor,
+    _disk_usage_percent,
 )
 
 
@@ -55,6 +65,40 @@ class TestResourceMetrics:
         assert 'timestamp' in data
         assert data['cpu_percent'] == 50.5
         assert isinstance(data['timestamp'], str)
+    
+    def test_metrics_to_dict_returns_independent_copies(self):
+        """Test mutating a serialized dict does not affect later calls"""
+        metrics = ResourceMetrics(
+            cpu_percent=50.0,
+            memory_percent=60.0,
+            memory_available_mb=1024.0,
+            disk_usage_percent=70.0,
+            process_memory_mb=100.0
+        )
+        
+        data = metrics.to_dict()
+        data['cpu_percent'] = 99.0
+        
+        assert metrics.to_dict()['cpu_percent'] == 50.0
+    
+    def test_metrics_serialization_cache_not_a_field(self):
+        """Test the to_dict cache stays out of dataclass helpers and pickles"""
+        metrics = ResourceMetrics(
+            cpu_percent=50.0,
+            memory_percent=60.0,
+            memory_available_mb=1024.0,
+            disk_usage_percent=70.0,
+            process_memory_mb=100.0
+        )
+        metrics.to_dict()
+        
+        assert [f.name for f in fields(metrics)] == [
+            'cpu_percent', 'memory_percent', 'memory_available_mb',
+            'disk_usage_percent', 'process_memory_mb', 'timestamp',
+        ]
+        assert set(asdict(metrics)) == {f.name for f in fields(metrics)}
+        assert replace(metrics, cpu_percent=10.0).to_dict()['cpu_percent'] == 10.0
+        assert pickle.loads(pickle.dumps(metrics)) == metrics
 
 
 class TestResourceThresholds:
@@ -80,6 +124,27 @@ class TestResourceThresholds:
         
         assert thresholds.cpu_warning == 60.0
         assert thresholds.cpu_critical == 80.0
+    
+    def test_thresholds_immutable(self):
+        """Test thresholds cannot be mutated in place"""
+        thresholds = ResourceThresholds()
+        
+        with pytest.raises(FrozenInstanceError):
+            thresholds.cpu_warning = 10.0
+    
+    def test_thresholds_plain_record(self):
+        """Test thresholds pickle and convert to dict as plain values"""
+        thresholds = ResourceThresholds(cpu_warning=60.0)
+        
+        assert pickle.loads(pickle.dumps(thresholds)) == thresholds
+        assert asdict(thresholds) == {
+            'cpu_warning': 60.0,
+            'cpu_critical': 90.0,
+            'memory_warning': 75.0,
+            'memory_critical': 90.0,
+            'disk_warning': 80.0,
+            'disk_critical': 95.0,
+        }
 
 
 class TestResourceMonitor:
@@ -101,7 +166,7 @@ class TestResourceMonitor:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_get_current_metrics(self, mock_disk, mock_memory, mock_cpu):
         """Test collecting current metrics"""
         # Mock psutil responses
@@ -110,9 +175,9 @@ class TestResourceMonitor:
             percent=55.0,
             available=1024 * 1024 * 1024  # 1GB
         )
-        mock_disk.return_value = Mock(percent=65.0)
+        mock_disk.return_value = 65.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         metrics = monitor.get_current_metrics()
         
         assert metrics.cpu_percent == 45.0
@@ -121,7 +186,7 @@ class TestResourceMonitor:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_check_resource_health_healthy(self, mock_disk, mock_memory, mock_cpu):
         """Test resource health check - healthy state"""
         # Mock healthy values
@@ -130,9 +195,9 @@ class TestResourceMonitor:
             percent=50.0,
             available=2048 * 1024 * 1024
         )
-        mock_disk.return_value = Mock(percent=50.0)
+        mock_disk.return_value = 50.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         status = monitor.check_resource_health()
         
         assert status['overall'] == ResourceStatus.HEALTHY.value
@@ -141,7 +206,30 @@ class TestResourceMonitor:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
+    def test_check_resource_health_cached_result_is_copied(self, mock_disk, mock_memory, mock_cpu):
+        """Test mutating a returned status does not affect the cached result"""
+        mock_cpu.return_value = 50.0
+        mock_memory.return_value = Mock(
+            percent=50.0,
+            available=2048 * 1024 * 1024
+        )
+        mock_disk.return_value = 50.0
+        
+        monitor = ResourceMonitor(cache_ttl_seconds=60.0, synthetic=False)
+        status = monitor.check_resource_health()
+        status['cpu'] = 'mutated'
+        
+        assert monitor.check_resource_health() == {
+            'cpu': 'healthy',
+            'memory': 'healthy',
+            'disk': 'healthy',
+            'overall': 'healthy',
+        }
+    
+    @patch('psutil.cpu_percent')
+    @patch('psutil.virtual_memory')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_check_resource_health_warning(self, mock_disk, mock_memory, mock_cpu):
         """Test resource health check - warning state"""
         # Mock warning-level CPU
@@ -150,9 +238,9 @@ class TestResourceMonitor:
             percent=50.0,
             available=2048 * 1024 * 1024
         )
-        mock_disk.return_value = Mock(percent=50.0)
+        mock_disk.return_value = 50.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         status = monitor.check_resource_health()
         
         assert status['overall'] == ResourceStatus.WARNING.value
@@ -161,7 +249,7 @@ class TestResourceMonitor:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_check_resource_health_critical(self, mock_disk, mock_memory, mock_cpu):
         """Test resource health check - critical state"""
         # Mock critical-level memory
@@ -170,9 +258,9 @@ class TestResourceMonitor:
             percent=95.0,  # Above 90% threshold
             available=100 * 1024 * 1024
         )
-        mock_disk.return_value = Mock(percent=50.0)
+        mock_disk.return_value = 50.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         status = monitor.check_resource_health()
         
         assert status['overall'] == ResourceStatus.CRITICAL.value
@@ -181,7 +269,68 @@ class TestResourceMonitor:
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
+    @patch('core.resource_monitor._disk_usage_percent')
+    def test_check_resource_health_threshold_boundaries(self, mock_disk, mock_memory, mock_cpu):
+        """Test values equal to a threshold fall into that threshold's level"""
+        mock_cpu.return_value = 70.0  # Exactly cpu_warning
+        mock_memory.return_value = Mock(
+            percent=90.0,  # Exactly memory_critical
+            available=2048 * 1024 * 1024
+        )
+        mock_disk.return_value = 79.9  # Just below disk_warning
+        
+        monitor = ResourceMonitor(synthetic=False)
+        status = monitor.check_resource_health()
+        
+        assert status['cpu'] == ResourceStatus.WARNING.value
+        assert status['memory'] == ResourceStatus.CRITICAL.value
+        assert status['disk'] == ResourceStatus.HEALTHY.value
+        assert status['overall'] == ResourceStatus.CRITICAL.value
+    
+    @patch('psutil.cpu_percent')
+    @patch('psutil.virtual_memory')
+    @patch('core.resource_monitor._disk_usage_percent')
+    def test_check_resource_health_critical_takes_precedence(self, mock_disk, mock_memory, mock_cpu):
+        """Test critical wins when configured below the warning threshold"""
+        mock_cpu.return_value = 92.0
+        mock_memory.return_value = Mock(
+            percent=50.0,
+            available=2048 * 1024 * 1024
+        )
+        mock_disk.return_value = 50.0
+        
+        thresholds = ResourceThresholds(cpu_warning=95.0, cpu_critical=90.0)
+        monitor = ResourceMonitor(thresholds=thresholds, synthetic=False)
+        status = monitor.check_resource_health()
+        
+        assert status['cpu'] == ResourceStatus.CRITICAL.value
+        assert status['overall'] == ResourceStatus.CRITICAL.value
+    
+    @patch('psutil.cpu_percent')
+    @patch('psutil.virtual_memory')
+    @patch('core.resource_monitor._disk_usage_percent')
+    def test_check_resource_health_recomputed_for_new_thresholds(self, mock_disk, mock_memory, mock_cpu):
+        """Test cached health status is not reused after thresholds change"""
+        mock_cpu.return_value = 65.0
+        mock_memory.return_value = Mock(
+            percent=50.0,
+            available=2048 * 1024 * 1024
+        )
+        mock_disk.return_value = 50.0
+        
+        monitor = ResourceMonitor(cache_ttl_seconds=60.0, synthetic=False)
+        first = monitor.check_resource_health()
+        assert monitor.check_resource_health() == first
+        
+        monitor.thresholds = replace(monitor.thresholds, cpu_warning=60.0)
+        status = monitor.check_resource_health()
+        
+        assert first['cpu'] == ResourceStatus.HEALTHY.value
+        assert status['cpu'] == ResourceStatus.WARNING.value
+    
+    @patch('psutil.cpu_percent')
+    @patch('psutil.virtual_memory')
+    @patch('core.resource_monitor._disk_usage_percent')
     def test_is_resource_available(self, mock_disk, mock_memory, mock_cpu):
         """Test resource availability check"""
         mock_cpu.return_value = 70.0  # 30% free
@@ -189,9 +338,9 @@ class TestResourceMonitor:
             percent=60.0,
             available=500 * 1024 * 1024  # 500MB
         )
-        mock_disk.return_value = Mock(percent=50.0)
+        mock_disk.return_value = 50.0
         
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         
         # Should have enough resources
         assert monitor.is_resource_available(
@@ -207,12 +356,12 @@ class TestResourceMonitor:
     
     def test_metrics_history(self):
         """Test metrics history tracking"""
-        monitor = ResourceMonitor(history_size=3)
+        monitor = ResourceMonitor(history_size=3, cache_ttl_seconds=0, synthetic=False)
         
         # Add metrics to history
         with patch('psutil.cpu_percent', return_value=50.0), \
              patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
-             patch('psutil.disk_usage', return_value=Mock(percent=50.0)):
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
             
             monitor.get_current_metrics()
             monitor.get_current_metrics()
@@ -224,13 +373,145 @@ class TestResourceMonitor:
         # Should only keep last 3
         assert len(history) == 3
     
+    def test_zero_history_size_retains_nothing(self):
+        """Test history_size=0 collects metrics without keeping history"""
+        monitor = ResourceMonitor(history_size=0, cache_ttl_seconds=0, synthetic=False)
+        
+        with patch('psutil.cpu_percent', return_value=50.0), \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            metrics = monitor.get_current_metrics()
+            summary = monitor.get_metrics_summary(duration_minutes=5)
+        
+        assert metrics.cpu_percent == 50.0
+        assert monitor.get_history() == []
+        assert summary == {'error': 'No metrics available'}
+    
+    def test_history_size_resize(self):
+        """Test shrinking history_size keeps only the most recent entries"""
+        monitor = ResourceMonitor(history_size=5, cache_ttl_seconds=0, synthetic=False)
+        
+        with patch('psutil.cpu_percent', return_value=50.0), \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            monitor.get_current_metrics()
+            latest = monitor.get_current_metrics()
+        
+        monitor.history_size = 1
+        history = monitor.get_history()
+        
+        assert monitor.history_size == 1
+        assert history == [latest.to_dict()]
+    
+    def test_cpu_sampling_primed_and_non_blocking(self):
+        """Test CPU percent is primed at init and sampled without blocking"""
+        with patch('psutil.cpu_percent', return_value=50.0) as mock_cpu, \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            monitor = ResourceMonitor(synthetic=False)
+            assert mock_cpu.call_count == 1
+            
+            monitor.get_current_metrics()
+        
+        assert mock_cpu.call_count == 2
+        for call in mock_cpu.call_args_list:
+            assert call.kwargs['interval'] == 0
+    
+    def test_cpu_baseline_taken_per_thread(self):
+        """Test another thread's first CPU sample blocks once, then not"""
+        with patch('psutil.cpu_percent', return_value=50.0) as mock_cpu, \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            monitor = ResourceMonitor(cache_ttl_seconds=0, synthetic=False)
+            worker = threading.Thread(target=lambda: [monitor.get_current_metrics() for _ in range(2)])
+            worker.start()
+            worker.join()
+        
+        intervals = [call.kwargs['interval'] for call in mock_cpu.call_args_list]
+        assert intervals[0] == 0  # Priming in the constructing thread
+        assert intervals[1] > 0  # Worker thread has no baseline yet
+        assert intervals[2] == 0
+    
+    def test_monitoring_disabled_skips_cpu_priming(self):
+        """Test a disabled monitor does not touch psutil at construction"""
+        with patch('psutil.cpu_percent') as mock_cpu:
+            ResourceMonitor(monitoring_enabled=False)
+        
+        mock_cpu.assert_not_called()
+    
+    def test_metrics_cached_within_ttl(self):
+        """Test repeated calls within the TTL reuse the last sample"""
+        monitor = ResourceMonitor(cache_ttl_seconds=60.0, synthetic=False)
+        
+        with patch('psutil.cpu_percent', return_value=50.0) as mock_cpu, \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            first = monitor.get_current_metrics()
+            calls = mock_cpu.call_count
+            second = monitor.get_current_metrics()
+        
+        assert second is first
+        assert mock_cpu.call_count == calls
+        assert len(monitor.get_history()) == 1
+    
+    def test_sample_timestamp_and_cache_share_one_clock_reading(self):
+        """Test the snapshot timestamp comes from the TTL clock reading"""
+        monitor = ResourceMonitor(cache_ttl_seconds=60.0, synthetic=True)
+        
+        with patch('core.resource_monitor.time.time', side_effect=[1000.0, 1010.0, 990.0]):
+            first = monitor.get_current_metrics()
+            cached = monitor.get_current_metrics()
+            # Clock stepped backwards: treat the cached sample as expired
+            stepped_back = monitor.get_current_metrics()
+        
+        assert first.timestamp == datetime.fromtimestamp(1000.0)
+        assert cached is first
+        assert stepped_back.timestamp == datetime.fromtimestamp(990.0)
+    
+    def test_use_cache_false_forces_fresh_sample(self):
+        """Test use_cache=False bypasses the sample cache"""
+        monitor = ResourceMonitor(cache_ttl_seconds=60.0, synthetic=False)
+        
+        with patch('psutil.cpu_percent', side_effect=[10.0, 95.0]), \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            assert monitor.is_resource_available(min_cpu_free=20.0) is True
+            assert monitor.is_resource_available(min_cpu_free=20.0, use_cache=False) is False
+            status = monitor.check_resource_health()
+        
+        assert status['cpu'] == ResourceStatus.CRITICAL.value
+    
+    def test_disk_usage_percent_matches_psutil(self):
+        """Test the statvfs-based disk percentage agrees with psutil"""
+        assert _disk_usage_percent('/') == pytest.approx(psutil.disk_usage('/').percent, abs=0.5)
+    
+    def test_disk_usage_sampled_on_interval(self):
+        """Test disk usage is reused between disk sampling intervals"""
+        monitor = ResourceMonitor(cache_ttl_seconds=0, disk_sample_interval_seconds=60.0, synthetic=False)
+        
+        with patch('psutil.cpu_percent', return_value=50.0), \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=65.0) as mock_disk:
+            
+            first = monitor.get_current_metrics()
+            second = monitor.get_current_metrics()
+        
+        assert mock_disk.call_count == 1
+        assert first.disk_usage_percent == second.disk_usage_percent == 65.0
+    
     def test_get_metrics_summary(self):
         """Test metrics summary generation"""
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(synthetic=False)
         
         with patch('psutil.cpu_percent', return_value=50.0), \
              patch('psutil.virtual_memory', return_value=Mock(percent=60.0, available=1024*1024*1024)), \
-             patch('psutil.disk_usage', return_value=Mock(percent=50.0)):
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
             
             # Collect some metrics
             monitor.get_current_metrics()
@@ -243,6 +524,237 @@ class TestResourceMonitor:
         assert 'samples' in summary
         assert summary['samples'] >= 1
     
+    def test_metrics_summary_aggregates_retained_history(self):
+        """Test summary statistics cover only samples still in history"""
+        monitor = ResourceMonitor(history_size=2, cache_ttl_seconds=0, synthetic=False)
+        
+        with patch('psutil.cpu_percent', side_effect=[10.0, 30.0, 50.0]), \
+             patch('psutil.virtual_memory', return_value=Mock(percent=60.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            for _ in range(3):
+                monitor.get_current_metrics()
+            
+            summary = monitor.get_metrics_summary(duration_minutes=5)
+        
+        assert summary['samples'] == 2
+        assert summary['cpu'] == {'min': 30.0, 'max': 50.0, 'avg': 40.0}
+        assert summary['memory']['avg'] == 60.0
+    
+    def test_metrics_summary_matches_history_after_evictions(self):
+        """Test running summary statistics stay exact as samples are evicted"""
+        # Disabled so the summary's own 'current' read is not recorded
+        monitor = ResourceMonitor(history_size=5, monitoring_enabled=False)
+        values = [42.0, 7.0, 99.0, 7.0, 63.0, 12.5, 99.0, 3.0, 55.0, 80.0, 1.0, 64.0]
+        
+        for i, value in enumerate(values):
+            monitor._add_to_history(ResourceMetrics(
+                cpu_percent=value,
+                memory_percent=100.0 - value,
+                memory_available_mb=1024.0,
+                disk_usage_percent=50.0,
+                process_memory_mb=100.0
+            ))
+            
+            retained = values[max(0, i - 4):i + 1]
+            summary = monitor.get_metrics_summary(duration_minutes=5)
+            
+            assert summary['samples'] == len(retained)
+            assert summary['cpu']['min'] == min(retained)
+            assert summary['cpu']['max'] == max(retained)
+            assert summary['cpu']['avg'] == pytest.approx(sum(retained) / len(retained))
+            assert summary['memory']['max'] == 100.0 - min(retained)
+    
+    def test_metrics_summary_fast_path_skips_index_materialization(self):
+        """Test a whole-history summary with fresh extremes does not build indices"""
+        monitor = ResourceMonitor(history_size=5, monitoring_enabled=False)
+        for value in [10.0, 20.0, 30.0]:
+            monitor._add_to_history(ResourceMetrics(
+                cpu_percent=value,
+                memory_percent=value,
+                memory_available_mb=1024.0,
+                disk_usage_percent=50.0,
+                process_memory_mb=100.0
+            ))
+        columns = monitor._metric_columns
+        
+        with patch.object(columns, 'valid_indices', wraps=columns.valid_indices) as mock_indices:
+            summary = monitor.get_metrics_summary(duration_minutes=5)
+        
+        mock_indices.assert_not_called()
+        assert summary['cpu'] == {'min': 10.0, 'max': 30.0, 'avg': 20.0}
+    
+    def test_history_consistent_under_concurrent_sampling(self):
+        """Test concurrent samples keep the history deque and columns in step"""
+        switch_interval = sys.getswitchinterval()
+        monitor = ResourceMonitor(history_size=7, cache_ttl_seconds=0, synthetic=True)
+        
+        def sample():
+            for _ in range(500):
+                monitor.get_current_metrics()
+        
+        workers = [threading.Thread(target=sample) for _ in range(8)]
+        sys.setswitchinterval(1e-6)
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        
+        assert monitor._metric_columns.count == len(monitor.get_history()) == 7
+        summary = monitor.get_metrics_summary(duration_minutes=5)
+        assert summary['cpu'] == {'min': 42.0, 'max': 42.0, 'avg': pytest.approx(42.0)}
+    
+    def test_running_stats_match_history_under_concurrent_sampling(self):
+        """Test running CPU sum stays exact when samples race across threads"""
+        monitor = ResourceMonitor(history_size=7, cache_ttl_seconds=0, synthetic=True)
+        cpu_values = itertools.cycle([5.0, 17.5, 42.0, 63.25, 99.0, 1.0])
+        
+        def fake_sample(now):
+            return ResourceMetrics(
+                cpu_percent=next(cpu_values),
+                memory_percent=50.0,
+                memory_available_mb=1024.0,
+                disk_usage_percent=50.0,
+                process_memory_mb=100.0,
+                timestamp=datetime.fromtimestamp(now)
+            )
+        
+        def sample():
+            for _ in range(500):
+                monitor.get_current_metrics()
+        
+        workers = [threading.Thread(target=sample) for _ in range(8)]
+        switch_interval = sys.getswitchinterval()
+        with patch.object(monitor, '_sample_metrics', side_effect=fake_sample):
+            sys.setswitchinterval(1e-6)
+            try:
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+            finally:
+                sys.setswitchinterval(switch_interval)
+        
+        history = monitor._metrics_history
+        cpu = [m.cpu_percent for m in history]
+        assert monitor._metric_columns.cpu_stats.total == pytest.approx(sum(cpu))
+        summary = monitor.get_metrics_summary(duration_minutes=5)
+        assert summary['cpu']['min'] == min(cpu)
+        assert summary['cpu']['max'] == max(cpu)
+    
+    def test_metrics_summary_excludes_samples_outside_window(self):
+        """Test summary only covers samples within the requested window"""
+        monitor = ResourceMonitor(monitoring_enabled=False)
+        now = datetime.now()
+        
+        for minutes_ago, cpu in [(20, 90.0), (2, 10.0), (1, 30.0)]:
+            monitor._add_to_history(ResourceMetrics(
+                cpu_percent=cpu,
+                memory_percent=50.0,
+                memory_available_mb=1024.0,
+                disk_usage_percent=50.0,
+                process_memory_mb=100.0,
+                timestamp=now - timedelta(minutes=minutes_ago)
+            ))
+        
+        summary = monitor.get_metrics_summary(duration_minutes=5)
+        
+        assert summary['samples'] == 2
+        assert summary['cpu'] == {'min': 10.0, 'max': 30.0, 'avg': 20.0}
+    
+    def test_get_history_health(self):
+        """Test history entries are classified against current thresholds"""
+        monitor = ResourceMonitor(monitoring_enabled=False)
+        
+        for cpu, memory, disk in [(10.0, 50.0, 50.0), (70.0, 50.0, 50.0), (50.0, 95.0, 85.0)]:
+            monitor._add_to_history(ResourceMetrics(
+                cpu_percent=cpu,
+                memory_percent=memory,
+                memory_available_mb=1024.0,
+                disk_usage_percent=disk,
+                process_memory_mb=100.0
+            ))
+        
+        health = monitor.get_history_health()
+        
+        assert [h['overall'] for h in health] == ['healthy', 'warning', 'critical']
+        assert health[1]['cpu'] == 'warning'
+        assert health[2] == {
+            'cpu': 'healthy',
+            'memory': 'critical',
+            'disk': 'warning',
+            'overall': 'critical',
+        }
+        assert monitor.get_history_health(count=1) == health[-1:]
+    
+    def test_get_history_health_agrees_with_live_check(self):
+        """Test history classification matches check_resource_health, inverted thresholds included"""
+        cpu_values = [50.0, 85.0, 92.0, 97.0]
+        thresholds = ResourceThresholds(cpu_warning=95.0, cpu_critical=90.0)
+        
+        with patch('psutil.cpu_percent', side_effect=[0.0] + cpu_values), \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0):
+            
+            monitor = ResourceMonitor(thresholds=thresholds, cache_ttl_seconds=0, synthetic=False)
+            live = [monitor.check_resource_health() for _ in cpu_values]
+        
+        assert monitor.get_history_health() == live
+        assert [h['cpu'] for h in live] == ['healthy', 'healthy', 'critical', 'critical']
+    
+    def test_synthetic_metrics_from_environment(self, monkeypatch):
+        """Test ASTRAGUARD_RM_SYNTHETIC=1 returns fixed metrics without psutil"""
+        monkeypatch.setenv('ASTRAGUARD_RM_SYNTHETIC', '1')
+        
+        with patch('psutil.cpu_percent') as mock_cpu, \
+             patch('psutil.virtual_memory') as mock_memory:
+            monitor = ResourceMonitor(cache_ttl_seconds=0)
+            metrics = monitor.get_current_metrics()
+            status = monitor.check_resource_health()
+        
+        mock_cpu.assert_not_called()
+        mock_memory.assert_not_called()
+        assert monitor.synthetic is True
+        assert metrics.cpu_percent == 42.0
+        assert metrics.memory_available_mb == 1024.0
+        assert status['overall'] == ResourceStatus.HEALTHY.value
+        assert len(monitor.get_history()) == 2
+    
+    def test_synthetic_mode_logs_warning(self, caplog):
+        """Test synthetic mode is announced so it cannot go unnoticed"""
+        with caplog.at_level('WARNING', logger='core.resource_monitor'):
+            ResourceMonitor(synthetic=True)
+        
+        assert "synthetic mode" in caplog.text
+    
+    def test_synthetic_explicit_argument_overrides_environment(self, monkeypatch):
+        """Test an explicit synthetic=False ignores the environment flag"""
+        monkeypatch.setenv('ASTRAGUARD_RM_SYNTHETIC', '1')
+        
+        assert ResourceMonitor(synthetic=False).synthetic is False
+    
+    def test_numpy_imported_on_first_history_append(self):
+        """Test importing the module and building a monitor skip numpy"""
+        import core.resource_monitor as resource_monitor
+        
+        code = (
+            "import sys\n"
+            "import core.resource_monitor as rm\n"
+            "monitor = rm.ResourceMonitor(synthetic=True)\n"
+            "assert 'numpy' not in sys.modules\n"
+            "monitor.get_current_metrics()\n"
+            "assert 'numpy' in sys.modules\n"
+        )
+        src_dir = os.path.dirname(os.path.dirname(resource_monitor.__file__))
+        env = dict(os.environ, PYTHONPATH=src_dir)
+        
+        result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+        
+        assert result.returncode == 0, result.stderr
+    
     def test_monitoring_disabled(self):
         """Test monitor with monitoring disabled"""
         monitor = ResourceMonitor(monitoring_enabled=False)
@@ -252,6 +764,22 @@ class TestResourceMonitor:
         # Should return zero values
         assert metrics.cpu_percent == 0.0
         assert metrics.memory_percent == 0.0
+        
+        # Should carry a current timestamp and not record anything
+        assert datetime.now() - metrics.timestamp < timedelta(seconds=5)
+        assert monitor.get_current_metrics().timestamp >= metrics.timestamp
+        assert monitor.get_history() == []
+    
+    def test_sampling_error_returns_current_zero_metrics(self):
+        """Test a psutil failure yields zeros stamped with the current time"""
+        monitor = ResourceMonitor(synthetic=False)
+        
+        with patch('psutil.virtual_memory', side_effect=RuntimeError("boom")):
+            metrics = monitor.get_current_metrics(use_cache=False)
+        
+        assert metrics.cpu_percent == 0.0
+        assert datetime.now() - metrics.timestamp < timedelta(seconds=5)
+        assert monitor.get_history() == []
 
 
 class TestResourceMonitorSingleton:
@@ -273,7 +801,6 @@ class TestResourceMonitorSingleton:
         os.environ['RESOURCE_MEMORY_WARNING'] = '70.0'
         
         # Reset singleton to force reload
-        from core import resource_monitor as rm
         from core.secrets import init_secrets_manager, get_secrets_manager
         
         # Initialize secrets manager if not already done with a test master key
@@ -283,7 +810,7 @@ class TestResourceMonitorSingleton:
             # Already initialized or key error - this is OK
             pass
         
-        rm._resource_monitor = None
+        reset_resource_monitor()
         try:
             get_secrets_manager().reload_cache()
         except (RuntimeError, AttributeError):
@@ -298,4 +825,32 @@ class TestResourceMonitorSingleton:
         # Cleanup
         del os.environ['RESOURCE_CPU_WARNING']
         del os.environ['RESOURCE_MEMORY_WARNING']
-        rm._resource_monitor = None
+        reset_resource_monitor()
+
+
+class TestMonitorOperationResources:
+    """Test operation resource monitoring decorator"""
+    
+    def test_memory_growth_detected_within_cache_ttl(self, caplog):
+        """Test short operations still get distinct before/after readings"""
+        monitor = ResourceMonitor(cache_ttl_seconds=60.0, synthetic=False)
+        process = MagicMock()
+        process.memory_info.side_effect = [
+            Mock(rss=100 * 1024 * 1024),
+            Mock(rss=350 * 1024 * 1024),
+        ]
+        
+        @monitor_operation_resources()
+        def allocate():
+            return "done"
+        
+        with patch('core.resource_monitor.get_resource_monitor', return_value=monitor), \
+             patch('psutil.Process', return_value=process), \
+             patch('psutil.cpu_percent', return_value=10.0), \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('core.resource_monitor._disk_usage_percent', return_value=50.0), \
+             caplog.at_level('WARNING', logger='core.resource_monitor'):
+            
+            assert allocate() == "done"
+        
+        assert "High memory usage in 'allocate'" in caplog.text